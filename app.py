@@ -1,7 +1,15 @@
 import streamlit as st
-from streamlit_folium import st_folium
-import folium
-from typing import Dict, Any, Tuple
+import numpy as np
+import json
+import logging
+from typing import Callable, Dict, Any, Optional, Tuple
+
+try:
+    import numba  # optional: compiles the all-parcel scoring loop
+except ImportError:
+    numba = None
+
+logger = logging.getLogger(__name__)
 
 
 # -----------------------------
@@ -14,49 +22,51 @@ st.set_page_config(
 )
 
 # Dark / Bloomberg-style theme via CSS overrides
-st.markdown(
-    """
-    <style>
-    body {
-        background-color: #050608;
-        color: #e5e7eb;
-    }
-    .block-container {
-        padding-top: 1.5rem;
-        padding-bottom: 1.5rem;
-        max-width: 1400px;
-    }
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #050608 0%, #111827 100%);
-        border-right: 1px solid #1f2933;
-    }
-    [data-testid="stMetricValue"] {
-        color: #f9fafb;
-    }
-    [data-testid="stMetricDelta"] {
-        color: #22c55e;
-    }
-    .suitability-pill {
-        padding: 0.15rem 0.65rem;
-        border-radius: 999px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        color: #f9fafb;
-        background: #111827;
-        border: 1px solid #374151;
-    }
-    .parcel-header {
-        font-weight: 600;
-        font-size: 0.9rem;
-        color: #e5e7eb;
-        margin-bottom: 0.1rem;
-    }
-    .pill-high { background: #166534 !important; }
-    .pill-medium { background: #9a3412 !important; }
-    .pill-low { background: #7f1d1d !important; }
-    </style>
-    """,
-    unsafe_allow_html=True,
+_THEME_CSS = """
+<style>
+body {
+    background-color: #050608;
+    color: #e5e7eb;
+}
+.block-container {
+    padding-top: 1.5rem;
+    padding-bottom: 1.5rem;
+    max-width: 1400px;
+}
+[data-testid="stSidebar"] {
+    background: linear-gradient(180deg, #050608 0%, #111827 100%);
+    border-right: 1px solid #1f2933;
+}
+[data-testid="stMetricValue"] {
+    color: #f9fafb;
+}
+[data-testid="stMetricDelta"] {
+    color: #22c55e;
+}
+.suitability-pill {
+    padding: 0.15rem 0.65rem;
+    border-radius: 999px;
+    font-size: 0.75rem;
+    font-weight: 600;
+    color: #f9fafb;
+    background: #111827;
+    border: 1px solid #374151;
+}
+.parcel-header {
+    font-weight: 600;
+    font-size: 0.9rem;
+    color: #e5e7eb;
+    margin-bottom: 0.1rem;
+}
+.pill-high { background: #166534 !important; }
+.pill-medium { background: #9a3412 !important; }
+.pill-low { background: #7f1d1d !important; }
+</style>
+"""
+
+_PAGE_HEADER_HTML = (
+    "<h2 style='color:#f9fafb; margin-bottom:0.25rem;'>Suitability Engine – Upper Midwest</h2>\n"
+    "<span style='color:#9ca3af; font-size:0.9rem;'>Twin Cities‑anchored multi‑factor land screening for institutional infrastructure.</span>"
 )
 
 
@@ -116,6 +126,51 @@ TAP_DATA: Dict[str, ParcelScores] = {
 }
 
 
+# Frozen, typed copy of TAP_DATA: one record per parcel, in TAP_DATA order.
+# Factor fields are raw 0–100 integer scores, so they fit in int8;
+# coordinates keep double precision.
+TAP = np.array(
+    [
+        (
+            name,
+            parcel["city"],
+            parcel["lat"],
+            parcel["lon"],
+            parcel["power_dist"],
+            parcel["fiber_dist"],
+            parcel["water_access"],
+            parcel["highway_access"],
+            parcel["rail_access"],
+            parcel["solar_potential"],
+            parcel["wind_potential"],
+            parcel["historical_contamination"],
+            parcel["council_sentiment"],
+            parcel["flood_zone_bool"],
+        )
+        for name, parcel in TAP_DATA.items()
+    ],
+    dtype=[
+        # Sized from the data so no name or city is truncated
+        ("name", f"U{max(map(len, TAP_DATA))}"),
+        ("city", f"U{max(len(parcel['city']) for parcel in TAP_DATA.values())}"),
+        ("lat", "f8"),
+        ("lon", "f8"),
+        ("power", "i1"),
+        ("fiber", "i1"),
+        ("water", "i1"),
+        ("highway", "i1"),
+        ("rail", "i1"),
+        ("solar", "i1"),
+        ("wind", "i1"),
+        ("contamination", "i1"),
+        ("sentiment", "i1"),
+        ("flood", bool),
+    ],
+)
+PARCEL_NAMES = TAP["name"].tolist()
+PARCEL_INDEX = {name: i for i, name in enumerate(PARCEL_NAMES)}
+
+
 # -----------------------------
 # Persona definitions
 # -----------------------------
@@ -157,6 +212,66 @@ PERSONA_WEIGHTS = {
 }
 
 
+# -----------------------------
+# Factor layout (vectorized scoring)
+# -----------------------------
+
+# Slider-weight keys, in weight-vector order
+WEIGHT_KEYS = [
+    "power",
+    "fiber",
+    "water",
+    "highway",
+    "rail",
+    "solar",
+    "wind",
+    "flood_risk",
+    "sentiment",
+]
+
+# Factor labels and the slider weight driving each, in factor-matrix column order
+FACTORS = [
+    ("Power", "power"),
+    ("Fiber", "fiber"),
+    ("Water", "water"),
+    ("Highway", "highway"),
+    ("Rail", "rail"),
+    ("Solar GHI", "solar"),
+    ("Wind", "wind"),
+    ("Low Flood Exposure", "flood_risk"),
+    ("Clean History", "sentiment"),  # contamination contributes to "friction" bucket
+    ("Council Sentiment", "sentiment"),
+]
+
+
+def _flood_exposure(flood_risk_slider: int) -> int:
+    """Score of the "Low Flood Exposure" factor for a parcel inside a flood zone."""
+    return max(0, 100 - 10 * flood_risk_slider)
+
+
+# Parcel × factor matrix, in FACTORS column order. "Bad" contamination is
+# inverted to become a positive signal. The flood-exposure column holds the
+# out-of-zone value (100) and is overwritten for flood-zone parcels at
+# scoring time.
+FACTOR_MATRIX = np.column_stack(
+    [
+        TAP["power"],
+        TAP["fiber"],
+        TAP["water"],
+        TAP["highway"],
+        TAP["rail"],
+        TAP["solar"],
+        TAP["wind"],
+        np.full(len(TAP), 100, dtype=np.int8),
+        100 - TAP["contamination"],
+        TAP["sentiment"],
+    ]
+)
+FLOOD_ZONE = TAP["flood"]
+FLOOD_FACTOR_IDX = [label for label, _ in FACTORS].index("Low Flood Exposure")
+FACTOR_TO_WEIGHT_IDX = np.array([WEIGHT_KEYS.index(key) for _, key in FACTORS])
+
+
 def ensure_slider_state_for_persona(persona: str) -> None:
     """Initialize or reset slider state based on selected persona."""
     weights = PERSONA_WEIGHTS[persona]
@@ -173,6 +288,49 @@ def apply_persona(persona: str) -> None:
         st.session_state[f"w_{key}"] = val
 
 
+def run_sentiment_scraper() -> None:
+    """Score the pasted transcript and feed it into the sentiment weight slider."""
+    sentiment_score = simulate_sentiment_score(st.session_state.get("transcript", ""))
+    # Map 0–100 sentiment to a 0–10 weight suggestion, but also
+    # store the 0–100 as a separate value for transparency.
+    suggested_weight = int(round(sentiment_score / 10))
+    st.session_state["w_sentiment"] = suggested_weight
+    st.session_state["last_scraped_sentiment"] = sentiment_score
+
+
+POSITIVE_WORDS = [
+    "support",
+    "in favor",
+    "approve",
+    "opportunity",
+    "jobs",
+    "investment",
+    "strategic",
+    "tax base",
+]
+NEGATIVE_WORDS = [
+    "oppose",
+    "against",
+    "concern",
+    "delay",
+    "litigation",
+    "moratorium",
+    "protest",
+    "traffic",
+    "pollution",
+]
+
+# Keywords match as plain substrings (e.g. "supporting" counts as "support"),
+# counted per keyword like str.count. A single alternation regex doesn't
+# work here: it consumes text as it matches, so run-together keywords such
+# as "jobsupport" or "protestraffic" would each lose a hit.
+_SENTIMENT_SIGN = {
+    **{w: 1 for w in POSITIVE_WORDS},
+    **{w: -1 for w in NEGATIVE_WORDS},
+}
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
 def simulate_sentiment_score(text: str) -> int:
     """
     Lightweight stand‑in for an LLM-based council sentiment scraper.
@@ -182,125 +340,192 @@ def simulate_sentiment_score(text: str) -> int:
         return 50
 
     t = text.lower()
-    positive_words = [
-        "support",
-        "in favor",
-        "approve",
-        "opportunity",
-        "jobs",
-        "investment",
-        "strategic",
-        "tax base",
-    ]
-    negative_words = [
-        "oppose",
-        "against",
-        "concern",
-        "delay",
-        "litigation",
-        "moratorium",
-        "protest",
-        "traffic",
-        "pollution",
-    ]
-
-    pos_hits = sum(t.count(w) for w in positive_words)
-    neg_hits = sum(t.count(w) for w in negative_words)
+    # One str.count per keyword: CPython's fast substring search beats a
+    # single-pass Aho–Corasick scan here, whose per-hit Python loop dominates.
+    delta = sum(sign * t.count(word) for word, sign in _SENTIMENT_SIGN.items())
 
-    base = 50 + 10 * (pos_hits - neg_hits)
+    base = 50 + 10 * delta
     return int(max(0, min(100, base)))
 
 
-def compute_parcel_score(
-    parcel: ParcelScores,
-    weights: Dict[str, float],
+def _weights_key(weights: Dict[str, float]) -> Tuple[float, ...]:
+    """Canonical, hashable form of a weights dict, in WEIGHT_KEYS order."""
+    return tuple(float(weights.get(key, 0.0)) for key in WEIGHT_KEYS)
+
+
+def _score_kernel(
+    factors: np.ndarray,
+    weights: np.ndarray,
     flood_risk_slider: int,
-) -> Tuple[float, Dict[str, float]]:
+    flood_zone: np.ndarray,
+    flood_col: int,
+) -> np.ndarray:
     """
-    Compute global suitability score (0–100) with:
-    - zero‑out gate on high flood risk aversion
-    - weighted, normalized factors
+    Explicit-loop form of the all-parcel scoring in _score_all, written for
+    numba: integer factors (parcels × FACTORS) and per-factor weights in,
+    0–100 scores out. Must match _score_all_numpy exactly.
     """
-    flood_zone = parcel["flood_zone_bool"]
+    n_parcels, n_factors = factors.shape
+    scores = np.zeros(n_parcels)
 
-    # Zero-out gate: if user is very flood-averse and parcel is in flood zone.
-    if flood_risk_slider >= 7 and flood_zone:
-        return 0.0, {}
-
-    # Factor normalization: all input scores are 0–100,
-    # but we invert "bad" contamination to become a positive signal.
-    power = parcel["power_dist"]
-    fiber = parcel["fiber_dist"]
-    water = parcel["water_access"]
-    highway = parcel["highway_access"]
-    rail = parcel["rail_access"]
-    solar = parcel["solar_potential"]
-    wind = parcel["wind_potential"]
-    contamination = 100 - parcel["historical_contamination"]
-    sentiment = parcel["council_sentiment"]
-
-    factor_scores = {
-        "Power": power,
-        "Fiber": fiber,
-        "Water": water,
-        "Highway": highway,
-        "Rail": rail,
-        "Solar GHI": solar,
-        "Wind": wind,
-        "Low Flood Exposure": 100 if not flood_zone else max(0, 100 - 10 * flood_risk_slider),
-        "Clean History": contamination,
-        "Council Sentiment": sentiment,
-    }
-
-    # Map factor labels to slider-weight keys
-    weight_mapping = {
-        "Power": "power",
-        "Fiber": "fiber",
-        "Water": "water",
-        "Highway": "highway",
-        "Rail": "rail",
-        "Solar GHI": "solar",
-        "Wind": "wind",
-        "Low Flood Exposure": "flood_risk",
-        "Council Sentiment": "sentiment",
-        "Clean History": "sentiment",  # contamination contributes to "friction" bucket
-    }
-
-    weighted_sum = 0.0
-    total_weight = 0.0
-    factor_contributions: Dict[str, float] = {}
-
-    for label, raw in factor_scores.items():
-        key = weight_mapping[label]
-        w = weights.get(key, 0.0)
-        if w <= 0:
+    total_weight = 0
+    for k in range(n_factors):
+        total_weight += weights[k]
+    if total_weight == 0:
+        return scores
+
+    exposure = max(0, 100 - 10 * flood_risk_slider)
+    for p in range(n_parcels):
+        # Zero-out gate: if user is very flood-averse and parcel is in flood zone.
+        if flood_zone[p] and flood_risk_slider >= 7:
             continue
-        contribution = raw * w
-        weighted_sum += contribution
-        total_weight += w * 100  # max factor value
-        factor_contributions[label] = contribution
+        weighted_sum = 0
+        for k in range(n_factors):
+            raw = factors[p, k]
+            if k == flood_col and flood_zone[p]:
+                raw = exposure
+            weighted_sum += raw * weights[k]
+        scores[p] = weighted_sum / total_weight
+    return scores
+
+
+@st.cache_resource(show_spinner=False)
+def _compiled_score_kernel() -> Optional[Callable[..., np.ndarray]]:
+    """
+    _score_kernel compiled with numba once per process, or None when numba
+    isn't installed (_score_all then uses _score_all_numpy).
+    fastmath stays off so the final division rounds exactly like NumPy's.
+    """
+    if numba is None:
+        return None
+    kernel = numba.njit(cache=True)(_score_kernel)
+
+    # The kernel is a second copy of the scoring math. A spot check here
+    # (first persona, flood gate open and closed) falls back to NumPy if it
+    # has drifted; tests/test_scoring.py sweeps every persona and setting.
+    persona_weights = next(iter(PERSONA_WEIGHTS.values()))
+    w_expanded = _expand_weights(tuple(persona_weights[key] for key in WEIGHT_KEYS))
+    for flood_risk_slider in (0, 10):
+        compiled = kernel(
+            FACTOR_MATRIX, w_expanded, flood_risk_slider, FLOOD_ZONE, FLOOD_FACTOR_IDX
+        )
+        if not np.array_equal(compiled, _score_all_numpy(w_expanded, flood_risk_slider)):
+            logger.warning(
+                "numba score kernel disagrees with NumPy scoring at "
+                "flood_risk_slider=%d; using NumPy scoring", flood_risk_slider
+            )
+            return None
+    return kernel
+
+
+def _expand_weights(weights: Tuple[float, ...]) -> np.ndarray:
+    """Per-factor integer weights (FACTORS order) from slider weights in WEIGHT_KEYS order."""
+    w = np.asarray(weights, dtype=np.int8)
+    return np.maximum(w[FACTOR_TO_WEIGHT_IDX], 0).astype(np.int32)
 
+
+def _score_all_numpy(w_expanded: np.ndarray, flood_risk_slider: int) -> np.ndarray:
+    """
+    NumPy form of the all-parcel scoring. Slider weights are 0–10 integers,
+    so the weighted sums are computed exactly in integer arithmetic and only
+    the final division is float.
+    """
+    total_weight = int(w_expanded.sum())
     if total_weight == 0:
-        return 0.0, factor_contributions
+        return np.zeros(len(PARCEL_NAMES))
 
-    score_0_100 = 100.0 * weighted_sum / total_weight
-    return score_0_100, factor_contributions
+    # Widen before the dot so sums can't overflow as factors are added
+    factors = FACTOR_MATRIX.astype(np.int32)
+    factors[FLOOD_ZONE, FLOOD_FACTOR_IDX] = _flood_exposure(flood_risk_slider)
+
+    # Zero-out gate: if user is very flood-averse and parcel is in flood zone.
+    mask = ~(FLOOD_ZONE & (flood_risk_slider >= 7))
+    return mask * (factors @ w_expanded) / total_weight
+
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def _score_all(weights: Tuple[float, ...], flood_risk_slider: int) -> np.ndarray:
+    """Memoized core of score_parcels; weights are in WEIGHT_KEYS order."""
+    w_expanded = _expand_weights(weights)
+    kernel = _compiled_score_kernel()
+    if kernel is not None:
+        return kernel(
+            FACTOR_MATRIX, w_expanded, flood_risk_slider, FLOOD_ZONE, FLOOD_FACTOR_IDX
+        )
+    return _score_all_numpy(w_expanded, flood_risk_slider)
 
 
-def score_to_bucket(score: float) -> str:
-    if score >= 75:
-        return "High"
-    if score >= 50:
-        return "Medium"
-    return "Low"
+# Compile the numba kernel when the app starts, not on the first cache miss.
+_compiled_score_kernel()
 
 
-def bucket_to_class(score: float) -> str:
-    if score >= 75:
-        return "pill-high"
-    if score >= 50:
-        return "pill-medium"
-    return "pill-low"
+def score_parcels(weights: Dict[str, float], flood_risk_slider: int) -> np.ndarray:
+    """
+    Global suitability scores (0–100) for every parcel, in PARCEL_NAMES order,
+    with:
+    - zero‑out gate on high flood risk aversion
+    - weighted, normalized factors
+    """
+    return _score_all(_weights_key(weights), flood_risk_slider)
+
+
+# Suitability buckets in ascending score order, with their pill CSS class
+_BUCKET_TABLE = [
+    ("Low", "pill-low"),
+    ("Medium", "pill-medium"),
+    ("High", "pill-high"),
+]
+# Lower score bound of each bucket after the first
+_BUCKET_CUTS = np.array([50.0, 75.0])
+
+
+def bucket_and_class(score: float) -> Tuple[str, str]:
+    """Suitability bucket label and pill CSS class for a 0–100 score."""
+    # side="right" so a score sitting on a cut belongs to the higher bucket
+    return _BUCKET_TABLE[int(np.searchsorted(_BUCKET_CUTS, score, side="right"))]
+
+
+# Sidebar weight sliders: (group, [(weight key, label, help), ...]) in display order
+SLIDER_GROUPS = [
+    (
+        "Utilities",
+        [
+            ("power", "Power", None),
+            ("fiber", "Fiber", None),
+            ("water", "Water", None),
+        ],
+    ),
+    (
+        "Logistics",
+        [
+            ("highway", "Highway", None),
+            ("rail", "Rail", None),
+        ],
+    ),
+    (
+        "Environment",
+        [
+            ("solar", "Solar GHI", None),
+            ("wind", "Wind", None),
+            (
+                "flood_risk",
+                "Flood Risk (aversion)",
+                "Higher = less tolerance for flood risk. Drives zero-out gate.",
+            ),
+        ],
+    ),
+    # Sentiment group (slider controlled or AI-updated)
+    (
+        "Sentiment",
+        [
+            (
+                "sentiment",
+                "Public / Political Friction (weight)",
+                "How much council sentiment & historical friction influence suitability.",
+            ),
+        ],
+    ),
+]
 
 
 def render_sidebar() -> Dict[str, float]:
@@ -317,110 +542,44 @@ def render_sidebar() -> Dict[str, float]:
     ensure_slider_state_for_persona(persona)
 
     # Optional "reset" button to re-apply institutional weights
-    if st.sidebar.button("Reset to Institutional Weights"):
-        apply_persona(persona)
-        st.experimental_rerun()
-
-    st.sidebar.markdown("---")
-
-    # Utilities
-    st.sidebar.subheader("Utilities")
-    w_power = st.sidebar.slider(
-        "Power",
-        min_value=0,
-        max_value=10,
-        value=st.session_state.get("w_power", PERSONA_WEIGHTS[persona]["power"]),
-        key="w_power",
-    )
-    w_fiber = st.sidebar.slider(
-        "Fiber",
-        min_value=0,
-        max_value=10,
-        value=st.session_state.get("w_fiber", PERSONA_WEIGHTS[persona]["fiber"]),
-        key="w_fiber",
-    )
-    w_water = st.sidebar.slider(
-        "Water",
-        min_value=0,
-        max_value=10,
-        value=st.session_state.get("w_water", PERSONA_WEIGHTS[persona]["water"]),
-        key="w_water",
+    st.sidebar.button(
+        "Reset to Institutional Weights",
+        on_click=apply_persona,
+        args=(persona,),
     )
 
-    # Logistics
-    st.sidebar.subheader("Logistics")
-    w_highway = st.sidebar.slider(
-        "Highway",
-        min_value=0,
-        max_value=10,
-        value=st.session_state.get("w_highway", PERSONA_WEIGHTS[persona]["highway"]),
-        key="w_highway",
-    )
-    w_rail = st.sidebar.slider(
-        "Rail",
-        min_value=0,
-        max_value=10,
-        value=st.session_state.get("w_rail", PERSONA_WEIGHTS[persona]["rail"]),
-        key="w_rail",
-    )
-
-    # Environment
-    st.sidebar.subheader("Environment")
-    w_solar = st.sidebar.slider(
-        "Solar GHI",
-        min_value=0,
-        max_value=10,
-        value=st.session_state.get("w_solar", PERSONA_WEIGHTS[persona]["solar"]),
-        key="w_solar",
-    )
-    w_wind = st.sidebar.slider(
-        "Wind",
-        min_value=0,
-        max_value=10,
-        value=st.session_state.get("w_wind", PERSONA_WEIGHTS[persona]["wind"]),
-        key="w_wind",
-    )
-    w_flood_risk = st.sidebar.slider(
-        "Flood Risk (aversion)",
-        min_value=0,
-        max_value=10,
-        value=st.session_state.get(
-            "w_flood_risk", PERSONA_WEIGHTS[persona]["flood_risk"]
-        ),
-        key="w_flood_risk",
-        help="Higher = less tolerance for flood risk. Drives zero-out gate.",
-    )
+    st.sidebar.markdown("---")
 
-    # Sentiment group (slider controlled or AI-updated)
-    st.sidebar.subheader("Sentiment")
-    w_sentiment = st.sidebar.slider(
-        "Public / Political Friction (weight)",
-        min_value=0,
-        max_value=10,
-        value=st.session_state.get(
-            "w_sentiment", PERSONA_WEIGHTS[persona]["sentiment"]
-        ),
-        key="w_sentiment",
-        help="How much council sentiment & historical friction influence suitability.",
-    )
+    # Slider state is guaranteed by ensure_slider_state_for_persona, so the
+    # sliders read their value from session state rather than a default.
+    # They sit in a form so adjusting several weights costs a single rerun;
+    # the buttons above and below stay outside it and act immediately.
+    weights: Dict[str, float] = {}
+    with st.sidebar.form("weights"):
+        for group, sliders in SLIDER_GROUPS:
+            st.subheader(group)
+            for key, label, help_text in sliders:
+                weights[key] = float(
+                    st.slider(
+                        label,
+                        min_value=0,
+                        max_value=10,
+                        key=f"w_{key}",
+                        help=help_text,
+                    )
+                )
+        st.form_submit_button("Apply weights")
 
     st.sidebar.markdown("---")
     st.sidebar.subheader("AI Sentiment Scraper (Simulated)")
-    transcript = st.sidebar.text_area(
+    st.sidebar.text_area(
         "City Council Transcript",
         height=160,
         key="transcript",
         placeholder="Paste an excerpt from a council or planning commission meeting here...",
     )
 
-    if st.sidebar.button("Run AI Sentiment Scraper"):
-        sentiment_score = simulate_sentiment_score(transcript)
-        # Map 0–100 sentiment to a 0–10 weight suggestion, but also
-        # store the 0–100 as a separate value for transparency.
-        suggested_weight = int(round(sentiment_score / 10))
-        st.session_state["w_sentiment"] = suggested_weight
-        st.session_state["last_scraped_sentiment"] = sentiment_score
-        st.experimental_rerun()
+    st.sidebar.button("Run AI Sentiment Scraper", on_click=run_sentiment_scraper)
 
     if "last_scraped_sentiment" in st.session_state:
         st.sidebar.caption(
@@ -428,45 +587,75 @@ def render_sidebar() -> Dict[str, float]:
             f"**{st.session_state['last_scraped_sentiment']} / 100**"
         )
 
-    return {
-        "power": float(w_power),
-        "fiber": float(w_fiber),
-        "water": float(w_water),
-        "highway": float(w_highway),
-        "rail": float(w_rail),
-        "solar": float(w_solar),
-        "wind": float(w_wind),
-        "flood_risk": float(w_flood_risk),
-        "sentiment": float(w_sentiment),
-    }
-
+    return weights
+
+
+MapKey = Tuple[Tuple[str, float, str], ...]
+
+# Client-side Leaflet map, centered roughly on the Twin Cities.
+# %MARKERS% is replaced with a JSON list of {lat, lon, color, popup}.
+_LEAFLET_MAP_TMPL = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css">
+<script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
+<style>html, body, #map { height: 100%; margin: 0; background: #050608; }</style>
+</head>
+<body>
+<div id="map"></div>
+<script>
+var map = L.map("map").setView([44.9778, -93.2650], 8);
+L.tileLayer("https://{s}.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}{r}.png", {
+    attribution: '&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors &copy; <a href="https://carto.com/attributions">CARTO</a>',
+    subdomains: "abcd",
+    maxZoom: 20
+}).addTo(map);
+var markers = %MARKERS%;
+markers.forEach(function (m) {
+    L.circleMarker([m.lat, m.lon], {
+        radius: 9,
+        fill: true,
+        fillOpacity: 0.9,
+        color: m.color,
+        fillColor: m.color
+    }).bindPopup(m.popup, {maxWidth: 300}).addTo(map);
+});
+</script>
+</body>
+</html>
+"""
+
+# Marker popup body
+_POPUP_TMPL = """
+<div style="font-family: system-ui, -apple-system, BlinkMacSystemFont, sans-serif; font-size: 12px; color:#f9fafb; background:#020617;">
+    <div style="font-weight:600; margin-bottom:4px;">{name}</div>
+    <div style="margin-bottom:4px; color:#9ca3af;">{city}</div>
+    <div style="margin-bottom:4px;">
+        <span style="display:inline-block;padding:2px 8px;border-radius:999px;background:#111827;border:1px solid #374151;">
+            Global Score: <span style="font-weight:600;">{score:.1f}</span> / 100
+        </span>
+    </div>
+    <div style="color:#9ca3af;">Bucket: <strong>{bucket}</strong></div>
+</div>
+""".strip()
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_map_html(scores_key: MapKey) -> str:
+    """
+    Build the Leaflet map page for a set of (name, rounded score, bucket)
+    entries. Markers are drawn in the browser from an embedded JSON blob.
+    """
+    scored = {name: (score, bucket) for name, score, bucket in scores_key}
 
-def render_map(global_scores: Dict[str, float]) -> None:
-    # Centered roughly on the Twin Cities
-    center_lat, center_lon = 44.9778, -93.2650
-    m = folium.Map(
-        location=[center_lat, center_lon],
-        zoom_start=8,
-        tiles="cartodbdark_matter",
-    )
+    markers = []
+    for name, city, lat, lon in zip(
+        PARCEL_NAMES, TAP["city"].tolist(), TAP["lat"].tolist(), TAP["lon"].tolist()
+    ):
+        score, bucket = scored.get(name, (0.0, bucket_and_class(0.0)[0]))
 
-    for name, parcel in TAP_DATA.items():
-        lat, lon = parcel["lat"], parcel["lon"]
-        score = global_scores.get(name, 0.0)
-        bucket = score_to_bucket(score)
-
-        popup_html = f"""
-        <div style="font-family: system-ui, -apple-system, BlinkMacSystemFont, sans-serif; font-size: 12px; color:#f9fafb; background:#020617;">
-            <div style="font-weight:600; margin-bottom:4px;">{name}</div>
-            <div style="margin-bottom:4px; color:#9ca3af;">{parcel['city']}</div>
-            <div style="margin-bottom:4px;">
-                <span style="display:inline-block;padding:2px 8px;border-radius:999px;background:#111827;border:1px solid #374151;">
-                    Global Score: <span style="font-weight:600;">{score:.1f}</span> / 100
-                </span>
-            </div>
-            <div style="color:#9ca3af;">Bucket: <strong>{bucket}</strong></div>
-        </div>
-        """
+        popup_html = _POPUP_TMPL.format(name=name, city=city, score=score, bucket=bucket)
         color = (
             "lime"
             if bucket == "High"
@@ -474,81 +663,88 @@ def render_map(global_scores: Dict[str, float]) -> None:
             if bucket == "Medium"
             else "red"
         )
+        markers.append({"lat": lat, "lon": lon, "color": color, "popup": popup_html})
 
-        folium.CircleMarker(
-            location=[lat, lon],
-            radius=9,
-            fill=True,
-            fill_opacity=0.9,
-            color=color,
-            fill_color=color,
-            popup=folium.Popup(popup_html, max_width=300),
-        ).add_to(m)
+    # Escape "</" so popup markup can't close the surrounding <script>
+    markers_json = json.dumps(markers).replace("</", "<\\/")
+    return _LEAFLET_MAP_TMPL.replace("%MARKERS%", markers_json)
 
-    st_folium(m, width="100%", height=600)
+
+def render_map(global_scores: Dict[str, float]) -> None:
+    # Only what the map displays goes into the cache key
+    scores_key = tuple(
+        sorted(
+            (name, round(score, 1), bucket_and_class(score)[0])
+            for name, score in global_scores.items()
+        )
+    )
+    st.iframe(_build_map_html(scores_key), height=600)
+
+
+# One ranked-list row; no blank lines so joined rows stay a single HTML block
+_PARCEL_ROW_TMPL = """
+<div style="display:flex;justify-content:space-between;align-items:center;padding:0.35rem 0.5rem;border-bottom:1px solid #1f2937;">
+    <div>
+        <div class="parcel-header">{name}</div>
+        <div style="font-size:0.75rem;color:#9ca3af;">{city}</div>
+    </div>
+    <div style="text-align:right;">
+        <div style="font-size:0.9rem;font-weight:600;color:#e5e7eb;">{score:0.1f}</div>
+        <span class="suitability-pill {pill_class}">{bucket} Suitability</span>
+    </div>
+</div>
+""".strip()
+
+
+def render_parcel_list(parcel_scores: Dict[str, float]) -> None:
+    st.subheader("Global Suitability Overview")
+
+    # Sort parcels by score descending
+    ranked = sorted(parcel_scores.items(), key=lambda x: x[1], reverse=True)
+    if ranked:
+        top_name, top_score = ranked[0]
+    else:
+        top_name, top_score = "—", 0.0
+
+    m1, m2 = st.columns(2)
+    with m1:
+        st.metric("Top Parcel Score", f"{top_score:0.1f} / 100")
+    with m2:
+        st.metric("Top Parcel", top_name)
+
+    st.markdown("### Parcels")
+    # All rows go out in a single markdown element
+    rows = []
+    for name, score in ranked:
+        bucket, pill_class = bucket_and_class(score)
+        rows.append(
+            _PARCEL_ROW_TMPL.format(
+                name=name,
+                city=TAP["city"][PARCEL_INDEX[name]],
+                score=score,
+                bucket=bucket,
+                pill_class=pill_class,
+            )
+        )
+    st.markdown(f"<div>{''.join(rows)}</div>", unsafe_allow_html=True)
 
 
 def main() -> None:
-    st.markdown(
-        "<h2 style='color:#f9fafb; margin-bottom:0.25rem;'>Suitability Engine – Upper Midwest</h2>",
-        unsafe_allow_html=True,
-    )
-    st.markdown(
-        "<span style='color:#9ca3af; font-size:0.9rem;'>Twin Cities‑anchored multi‑factor land screening for institutional infrastructure.</span>",
-        unsafe_allow_html=True,
-    )
+    # Theme CSS and page header go out as a single element. It is re-sent on
+    # every run: Streamlit removes any element a rerun doesn't emit again.
+    st.markdown(_THEME_CSS + _PAGE_HEADER_HTML, unsafe_allow_html=True)
 
     weights = render_sidebar()
 
-    # Compute scores per parcel
-    parcel_scores: Dict[str, float] = {}
-    for name, parcel in TAP_DATA.items():
-        score, _ = compute_parcel_score(
-            parcel=parcel,
-            weights=weights,
-            flood_risk_slider=int(weights["flood_risk"]),
-        )
-        parcel_scores[name] = score
+    # Compute scores for all parcels in one pass
+    scores = score_parcels(weights, flood_risk_slider=int(weights["flood_risk"]))
+    parcel_scores: Dict[str, float] = dict(zip(PARCEL_NAMES, scores.tolist()))
 
     # Layout: left metrics + table, right map
     col_left, col_right = st.columns([0.45, 0.55], gap="large")
 
     with col_left:
-        st.subheader("Global Suitability Overview")
-
-        # Sort parcels by score descending
-        ranked = sorted(parcel_scores.items(), key=lambda x: x[1], reverse=True)
-        if ranked:
-            top_name, top_score = ranked[0]
-        else:
-            top_name, top_score = "—", 0.0
-
-        m1, m2 = st.columns(2)
-        with m1:
-            st.metric("Top Parcel Score", f"{top_score:0.1f} / 100")
-        with m2:
-            st.metric("Top Parcel", top_name)
-
-        st.markdown("### Parcels")
-        for name, score in ranked:
-            bucket = score_to_bucket(score)
-            pill_class = bucket_to_class(score)
-            city = TAP_DATA[name]["city"]
-            st.markdown(
-                f"""
-                <div style="display:flex;justify-content:space-between;align-items:center;padding:0.35rem 0.5rem;border-bottom:1px solid #1f2937;">
-                    <div>
-                        <div class="parcel-header">{name}</div>
-                        <div style="font-size:0.75rem;color:#9ca3af;">{city}</div>
-                    </div>
-                    <div style="text-align:right;">
-                        <div style="font-size:0.9rem;font-weight:600;color:#e5e7eb;">{score:0.1f}</div>
-                        <span class="suitability-pill {pill_class}">{bucket} Suitability</span>
-                    </div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+        render_parcel_list(parcel_scores)
 
     with col_right:
         st.subheader("Spatial View")
@@ -0,0 +1,27 @@
+import itertools
+import os
+import sys
+
+import numpy as np
+import pytest
+
+numba = pytest.importorskip("numba")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import app  # noqa: E402
+
+WEIGHT_SETS = [
+    tuple(weights[key] for key in app.WEIGHT_KEYS) for weights in app.PERSONA_WEIGHTS.values()
+] + [(0,) * len(app.WEIGHT_KEYS), (10,) * len(app.WEIGHT_KEYS)]
+
+
+@pytest.mark.parametrize(
+    "weights,flood_risk_slider", list(itertools.product(WEIGHT_SETS, range(11)))
+)
+def test_numba_kernel_matches_numpy(weights, flood_risk_slider):
+    kernel = numba.njit(app._score_kernel)
+    w_expanded = app._expand_weights(weights)
+    compiled = kernel(
+        app.FACTOR_MATRIX, w_expanded, flood_risk_slider, app.FLOOD_ZONE, app.FLOOD_FACTOR_IDX
+    )
+    assert np.array_equal(compiled, app._score_all_numpy(w_expanded, flood_risk_slider))